@@ -4,12 +4,27 @@ import json
 import math
 import sys
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, Iterable, List
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def read_json(path: Path) -> Any:
+    data = path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity literals that the stdlib decoder accepts.
+            pass
+    return json.loads(data)
 
 
 def load_baseline(path: Path) -> Dict[str, float]:
-    with path.open("r", encoding="utf-8") as handle:
-        raw = json.load(handle)
+    raw = read_json(path)
     if not isinstance(raw, dict):
         raise ValueError("baseline must be a JSON object {benchmark: score}")
     baseline: Dict[str, float] = {}
@@ -19,8 +34,7 @@ def load_baseline(path: Path) -> Dict[str, float]:
 
 
 def load_current(path: Path) -> Dict[str, float]:
-    with path.open("r", encoding="utf-8") as handle:
-        raw = json.load(handle)
+    raw = read_json(path)
     if not isinstance(raw, list):
         raise ValueError("current JMH result must be a JSON array")
     current: Dict[str, float] = {}
@@ -37,12 +51,19 @@ def load_current(path: Path) -> Dict[str, float]:
     return current
 
 
-def threshold_for(benchmark: str, flat_threshold: float, embedded_threshold: float) -> float:
-    if ".flat_" in benchmark:
-        return flat_threshold
-    if ".embedded_" in benchmark:
-        return embedded_threshold
-    return max(flat_threshold, embedded_threshold)
+def thresholds_by_benchmark(
+    benchmarks: Iterable[str], flat_threshold: float, embedded_threshold: float
+) -> Dict[str, float]:
+    default_threshold = max(flat_threshold, embedded_threshold)
+    thresholds: Dict[str, float] = {}
+    for benchmark in benchmarks:
+        if ".flat_" in benchmark:
+            thresholds[benchmark] = flat_threshold
+        elif ".embedded_" in benchmark:
+            thresholds[benchmark] = embedded_threshold
+        else:
+            thresholds[benchmark] = default_threshold
+    return thresholds
 
 
 def main() -> int:
@@ -56,16 +77,18 @@ def main() -> int:
     baseline = load_baseline(Path(args.baseline))
     current = load_current(Path(args.current))
 
+    thresholds = thresholds_by_benchmark(baseline, args.flat_threshold, args.embedded_threshold)
+
     failures: List[str] = []
     for benchmark, baseline_score in baseline.items():
-        if benchmark not in current:
+        current_score = current.get(benchmark)
+        if current_score is None:
             failures.append(f"missing benchmark result: {benchmark}")
             continue
-        current_score = current[benchmark]
         if baseline_score <= 0:
             failures.append(f"invalid baseline score for {benchmark}: {baseline_score}")
             continue
-        allowed = threshold_for(benchmark, args.flat_threshold, args.embedded_threshold)
+        allowed = thresholds[benchmark]
         min_score = baseline_score * (1.0 - allowed)
         if current_score < min_score:
             regression = (baseline_score - current_score) / baseline_score
@@ -75,15 +98,16 @@ def main() -> int:
             )
 
     if failures:
-        print("JMH regression check failed:")
-        for failure in failures:
-            print(f" - {failure}")
+        lines = ["JMH regression check failed:"]
+        lines.extend(f" - {failure}" for failure in failures)
+        sys.stdout.write("\n".join(lines) + "\n")
         return 1
 
-    print("JMH regression check passed.")
+    lines = ["JMH regression check passed."]
     for benchmark, baseline_score in baseline.items():
         current_score = current.get(benchmark, float("nan"))
-        print(f" - {benchmark}: baseline={baseline_score:.3f}, current={current_score:.3f}")
+        lines.append(f" - {benchmark}: baseline={baseline_score:.3f}, current={current_score:.3f}")
+    sys.stdout.write("\n".join(lines) + "\n")
     return 0
 
 
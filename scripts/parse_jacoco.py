@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import heapq
 import sys
 import xml.etree.ElementTree as ET
 from pathlib import Path
@@ -16,36 +17,30 @@ def main():
     if not path.exists():
         print(f'ERROR: file not found: {path}', file=sys.stderr)
         sys.exit(2)
-    tree = ET.parse(path)
-    root = tree.getroot()
     classes = []
-    for pkg in root.findall('.//package'):
-        for cls in pkg.findall('class'):
-            name = cls.get('name')
-            # find LINE counter
-            line_counter = None
-            for c in cls.findall('counter'):
-                if c.get('type') == 'LINE':
-                    line_counter = c
-                    break
+    # stream the report, clearing each class, sourcefile and package once handled
+    for _, elem in ET.iterparse(path, events=('end',)):
+        if elem.tag == 'class':
+            name = elem.get('name')
+            # one pass over the counters; prefer LINE, fall back to INSTRUCTION
+            counters = {c.get('type'): c for c in elem.iterfind('counter')}
+            line_counter = counters.get('LINE')
             if line_counter is None:
-                # fallback to INSTRUCTION
-                for c in cls.findall('counter'):
-                    if c.get('type') == 'INSTRUCTION':
-                        line_counter = c
-                        break
-            if line_counter is None:
-                continue
-            missed = int(line_counter.get('missed'))
-            covered = int(line_counter.get('covered'))
-            pct = percent(missed, covered)
-            classes.append((name.replace('/', '.'), missed, covered, pct))
-    # sort by pct ascending, then by missed desc
-    classes.sort(key=lambda x: (x[3], -x[1]))
-    print(f"Found {len(classes)} classes")
-    print("Rank  Coverage%  Missed Covered  Class")
-    for i, (name, missed, covered, pct) in enumerate(classes[:20], start=1):
-        print(f"{i:2d}.   {pct:6.2f}%   {missed:6d} {covered:7d}  {name}")
+                line_counter = counters.get('INSTRUCTION')
+            if line_counter is not None:
+                missed = int(line_counter.get('missed'))
+                covered = int(line_counter.get('covered'))
+                pct = percent(missed, covered)
+                classes.append((name.replace('/', '.'), missed, covered, pct))
+            elem.clear()
+        elif elem.tag in ('sourcefile', 'package'):
+            elem.clear()
+    # lowest 20 by pct ascending, then by missed desc (same order as a stable sort)
+    top = heapq.nsmallest(20, classes, key=lambda x: (x[3], -x[1]))
+    lines = [f"Found {len(classes)} classes", "Rank  Coverage%  Missed Covered  Class"]
+    for i, (name, missed, covered, pct) in enumerate(top, start=1):
+        lines.append(f"{i:2d}.   {pct:6.2f}%   {missed:6d} {covered:7d}  {name}")
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 if __name__ == '__main__':
     main()